@@ -4,12 +4,82 @@ Main application logic and orchestration.
 """
 
 import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 from src.file_handler import FileHandler
 from src.logger import Logger
 
 
+def convert_pdf(pdf_file: Path, output_dir: Path, verbose: bool = False) -> int:
+    """
+    Convert a single PDF file to CSV.
+    
+    Defined at module level so it can be dispatched to worker processes.
+    
+    Args:
+        pdf_file: Path to PDF file
+        output_dir: Output directory for CSV files
+        verbose: Enable verbose output
+        
+    Returns:
+        Number of transactions written (0 if none were found)
+    """
+    from src.pdf_parser import PDFParser
+    from src.transaction_parser import TransactionParser
+    from src.csv_writer import CSVWriter
+    
+    # Worker-side logger for the per-step diagnostics in verbose mode
+    logger = Logger(verbose=verbose)
+    
+    # Step 1: Extract text from PDF
+    logger.debug(f"Extracting text from {pdf_file.name}")
+    text = PDFParser(verbose=verbose).extract_text(pdf_file)
+    
+    # Step 2: Parse transactions (streamed straight into the writer)
+    logger.debug(f"Parsing transactions from {pdf_file.name}")
+    transactions = TransactionParser(verbose=verbose).iter_parse(text)
+    first = next(transactions, None)
+    if first is None:
+        return 0
+    
+    # Step 3: Write to CSV (the count is only known once writing is done)
+    csv_path = FileHandler(verbose=verbose).get_output_csv_path(pdf_file, output_dir)
+    logger.debug(f"Writing transactions to {csv_path.name}")
+    count = CSVWriter(verbose=verbose).write(chain((first,), transactions), csv_path)
+    logger.debug(f"Wrote {count} transactions to {csv_path.name}")
+    return count
+
+
+def _convert_pdf_task(
+    pdf_file: Path,
+    output_dir: Path,
+    verbose: bool
+) -> Tuple[int, Optional[str], Optional[str]]:
+    """
+    Run convert_pdf in a worker process, capturing any error.
+    
+    Errors are returned instead of raised so one failing PDF does not
+    abort the remaining results of a mapped batch.
+    
+    Args:
+        pdf_file: Path to PDF file
+        output_dir: Output directory for CSV files
+        verbose: Enable verbose output
+        
+    Returns:
+        Tuple of (transaction count, error message, formatted traceback)
+    """
+    try:
+        return convert_pdf(pdf_file, output_dir, verbose), None, None
+    except Exception as e:
+        import traceback
+        return 0, str(e), traceback.format_exc()
+
+
 class Application:
     """
     Main application class that orchestrates the conversion process.
@@ -48,7 +118,7 @@ class Application:
             # Step 3: Display summary
             self._display_summary(pdf_files, output_dir)
             
-            # Step 4: Process PDFs (not yet implemented)
+            # Step 4: Process PDFs
             self._process_pdfs(pdf_files, output_dir)
             
             return 0
@@ -106,55 +176,65 @@ class Application:
             for pdf in pdf_files:
                 self.logger.info(f"  {pdf}")
     
+    def _get_worker_count(self, file_count: int) -> int:
+        """
+        Determine number of worker processes.
+        
+        Args:
+            file_count: Number of PDF files to process
+            
+        Returns:
+            Worker count (never more than the number of files)
+        """
+        workers = self.args.workers or os.cpu_count() or 1
+        return max(1, min(workers, file_count))
+    
     def _process_pdfs(self, pdf_files: List[Path], output_dir: Path) -> None:
         """
         Process all PDF files and convert to CSV.
         
+        Files are converted in parallel worker processes, dispatched in
+        batches of --batch-size; results are reported in input order.
+        
         Args:
             pdf_files: List of PDF files to process
             output_dir: Output directory for CSV files
         """
-        from src.pdf_parser import PDFParser
-        from src.transaction_parser import TransactionParser
-        from src.csv_writer import CSVWriter
-        
-        pdf_parser = PDFParser(verbose=self.args.verbose)
-        transaction_parser = TransactionParser(verbose=self.args.verbose)
-        csv_writer = CSVWriter(verbose=self.args.verbose)
+        workers = self._get_worker_count(len(pdf_files))
+        batch_size = self.args.batch_size
+        self.logger.debug(f"Using {workers} worker process(es), batch size {batch_size}")
         
         success_count = 0
         error_count = 0
         
-        for pdf_file in pdf_files:
-            try:
-                self.logger.info(f"Processing: {pdf_file.name}")
-                
-                # Step 1: Extract text from PDF
-                self.logger.debug(f"Extracting text from {pdf_file.name}")
-                text = pdf_parser.extract_text(pdf_file)
-                
-                # Step 2: Parse transactions
-                self.logger.debug(f"Parsing transactions from {pdf_file.name}")
-                transactions = transaction_parser.parse(text)
-                
-                if not transactions:
-                    self.logger.warning(f"No transactions found in {pdf_file.name}")
-                    continue
-                
-                # Step 3: Write to CSV
-                csv_path = self.file_handler.get_output_csv_path(pdf_file, output_dir)
-                self.logger.debug(f"Writing {len(transactions)} transactions to {csv_path.name}")
-                csv_writer.write(transactions, csv_path)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for start in range(0, len(pdf_files), batch_size):
+                batch = pdf_files[start:start + batch_size]
                 
-                self.logger.success(f"Successfully converted {pdf_file.name} ({len(transactions)} transactions)")
-                success_count += 1
+                # Larger chunks cut IPC round-trips for many small PDFs
+                chunksize = max(1, len(batch) // (4 * workers))
+                results = executor.map(
+                    _convert_pdf_task,
+                    batch,
+                    repeat(output_dir),
+                    repeat(self.args.verbose),
+                    chunksize=chunksize
+                )
                 
-            except Exception as e:
-                self.logger.error(f"Failed to process {pdf_file.name}: {e}")
-                error_count += 1
-                if self.args.verbose:
-                    import traceback
-                    traceback.print_exc()
+                for pdf_file, (transaction_count, error, details) in zip(batch, results):
+                    if error is not None:
+                        self.logger.error(f"Failed to process {pdf_file.name}: {error}")
+                        error_count += 1
+                        if self.args.verbose:
+                            sys.stderr.write(details)
+                        continue
+                    
+                    if not transaction_count:
+                        self.logger.warning(f"No transactions found in {pdf_file.name}")
+                        continue
+                    
+                    self.logger.success(f"Successfully converted {pdf_file.name} ({transaction_count} transactions)")
+                    success_count += 1
         
         # Final summary
-        self.logger.info(f"\nProcessing complete: {success_count} successful, {error_count} failed")
\ No newline at end of file
+        self.logger.info(f"\nProcessing complete: {success_count} successful, {error_count} failed")
@@ -21,6 +21,7 @@ Examples:
   %(prog)s /path/to/statement.pdf
   %(prog)s /path/to/statements/
   %(prog)s /path/to/statement.pdf --output /custom/output/
+  %(prog)s /path/to/statements/ --workers 4 --batch-size 64
         """
     )
     
@@ -37,6 +38,20 @@ Examples:
         help="Custom output directory (default: 'csv' folder in input directory)"
     )
     
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes for converting PDFs (default: CPU count)"
+    )
+    
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=32,
+        help="Number of PDFs dispatched to the workers at a time (default: 32)"
+    )
+    
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -49,4 +64,12 @@ Examples:
         version="%(prog)s 0.1.0"
     )
     
-    return parser.parse_args()
\ No newline at end of file
+    args = parser.parse_args()
+    
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    
+    return args
\ No newline at end of file
@@ -3,9 +3,12 @@ CSV Writer Module
 Writes transaction data to CSV files in Commerzbank format.
 """
 
-import csv
+import os
+from decimal import Decimal
+from itertools import chain, islice, repeat
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Sequence, Tuple
+from src.formatting import format_betrag, format_date
 from src.models import Transaction
 
 
@@ -17,8 +20,15 @@ class CSVWriter:
     # Commerzbank CSV format specification
     DELIMITER = ';'
     QUOTECHAR = '"'
+    LINE_TERMINATOR = '\r\n'
     ENCODING = 'utf-8'
     
+    # Write buffer size in bytes (1 MiB keeps large statements to few syscalls)
+    BUFFER_SIZE = 1 << 20
+    
+    # Transactions formatted column-by-column per chunk
+    CHUNK_SIZE = 1024
+    
     # CSV header (Commerzbank format)
     HEADER = [
         'Buchungstag',
@@ -32,56 +42,80 @@ class CSVWriter:
         'IBAN Auftraggeberkonto'
     ]
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, buffer_size: int = BUFFER_SIZE):
         """
         Initialize CSV writer.
         
         Args:
             verbose: Enable verbose output
+            buffer_size: Size of the output file buffer in bytes
         """
         self.verbose = verbose
+        self.buffer_size = buffer_size
+        
+        # Every field is quoted, so a row is one join over these pieces
+        self._line_start = self.QUOTECHAR
+        self._separator = self.QUOTECHAR + self.DELIMITER + self.QUOTECHAR
+        self._line_end = self.QUOTECHAR + self.LINE_TERMINATOR
+        self._header_bytes = self._format_line(self.HEADER).encode(self.ENCODING)
     
     def write(
         self, 
-        transactions: List[Transaction], 
+        transactions: Iterable[Transaction], 
         output_path: Path
-    ) -> None:
+    ) -> int:
         """
         Write transactions to CSV file.
         
+        Rows are pulled from the iterable in chunks of CHUNK_SIZE, so a
+        generator is streamed without being materialized. Each chunk is
+        encoded once and written to the binary file in a single call.
+        
+        If the iterable raises part-way, no partial file is left behind
+        and an existing output_path is left untouched.
+        
         Args:
-            transactions: List of Transaction objects
+            transactions: Iterable of Transaction objects
             output_path: Path to output CSV file
             
+        Returns:
+            Number of transactions written
+            
         Raises:
             ValueError: If transactions list is empty
             PermissionError: If file cannot be written
         """
-        if not transactions:
+        # Pull the first item up front so an empty iterable is rejected
+        # before the file is created
+        remaining = iter(transactions)
+        first = next(remaining, None)
+        if first is None:
             raise ValueError("Cannot write CSV: transactions list is empty")
         
         self._validate_output_path(output_path)
         
+        # Rows go to a sibling temporary file that replaces output_path
+        # only on success, so a failed write never truncates an old export
+        temp_path = output_path.with_name(f".{output_path.name}.tmp")
+        csvfile = open(temp_path, 'wb', buffering=self.buffer_size)
+        count = 0
         try:
-            with open(output_path, 'w', newline='', encoding=self.ENCODING) as csvfile:
-                writer = csv.DictWriter(
-                    csvfile,
-                    fieldnames=self.HEADER,
-                    delimiter=self.DELIMITER,
-                    quotechar=self.QUOTECHAR,
-                    quoting=csv.QUOTE_ALL
-                )
-                
+            with csvfile:
                 # Write header
-                writer.writeheader()
+                csvfile.write(self._header_bytes)
                 
                 # Write transactions
-                for transaction in transactions:
-                    row = self._transaction_to_row(transaction)
-                    writer.writerow(row)
-                    
-        except PermissionError as e:
-            raise PermissionError(f"Cannot write to file: {output_path}") from e
+                for chunk in self._iter_chunks(chain((first,), remaining)):
+                    lines = map(self._format_line, self._chunk_to_rows(chunk))
+                    csvfile.write(''.join(lines).encode(self.ENCODING))
+                    count += len(chunk)
+            
+            os.replace(temp_path, output_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        
+        return count
     
     def _validate_output_path(self, output_path: Path) -> None:
         """
@@ -92,34 +126,91 @@ class CSVWriter:
             
         Raises:
             ValueError: If path is not a .csv file
+            PermissionError: If file cannot be written
         """
         if output_path.suffix.lower() != '.csv':
             raise ValueError(f"Output file must have .csv extension: {output_path}")
+        
+        # Check the file itself if it exists, otherwise the directory it goes
+        # into; a missing directory is left to open() (FileNotFoundError)
+        if output_path.exists():
+            target = output_path
+        elif output_path.parent.exists():
+            target = output_path.parent
+        else:
+            return
+        
+        if not os.access(target, os.W_OK):
+            raise PermissionError(f"Cannot write to file: {output_path}")
     
-    def _transaction_to_row(self, transaction: Transaction) -> dict:
+    def _format_line(self, row: Sequence[str]) -> str:
         """
-        Convert Transaction object to CSV row dictionary.
+        Format a row as a fully quoted CSV line.
         
         Args:
-            transaction: Transaction object
+            row: Field values, already escaped for quoting
             
         Returns:
-            Dictionary with CSV column names as keys
-        """
-        # Determine transaction type (Umsatzart)
-        umsatzart = self._get_umsatzart(transaction)
-        
-        return {
-            'Buchungstag': transaction.buchungsdatum.strftime('%d.%m.%Y'),
-            'Wertstellung': transaction.valuta.strftime('%d.%m.%Y'),
-            'Umsatzart': umsatzart,
-            'Buchungstext': transaction.verwendungszweck or transaction.beschreibung,
-            'Betrag': self._format_betrag(transaction.betrag),
-            'Währung': transaction.waehrung,
-            'Auftraggeberkonto': '',  # Not available in PDF
-            'Bankleitzahl Auftraggeberkonto': '',  # Not available in PDF
-            'IBAN Auftraggeberkonto': transaction.gegenkonto_iban or ''
-        }
+            CSV line including line terminator
+        """
+        return self._line_start + self._separator.join(row) + self._line_end
+    
+    def _escape(self, value: str) -> str:
+        """
+        Escape quote characters by doubling them.
+        
+        Args:
+            value: Raw field value
+            
+        Returns:
+            Field value safe to place between quotes
+        """
+        return value.replace(self.QUOTECHAR, self.QUOTECHAR * 2)
+    
+    def _iter_chunks(self, transactions: Iterator[Transaction]) -> Iterator[List[Transaction]]:
+        """
+        Split transactions into chunks of CHUNK_SIZE.
+        
+        Args:
+            transactions: Iterator of Transaction objects
+            
+        Yields:
+            Lists of at most CHUNK_SIZE transactions
+        """
+        while True:
+            chunk = list(islice(transactions, self.CHUNK_SIZE))
+            if not chunk:
+                return
+            yield chunk
+    
+    def _chunk_to_rows(self, chunk: List[Transaction]) -> Iterator[Tuple[str, ...]]:
+        """
+        Convert a chunk of transactions to CSV row tuples.
+        
+        Each column is formatted in its own pass over the chunk and the
+        columns are zipped back into rows. Free-text fields are escaped
+        for quoting; generated fields (dates, amount, type) never contain
+        quote characters.
+        
+        Args:
+            chunk: Transaction objects
+            
+        Returns:
+            Iterator of tuples of field values in HEADER order
+        """
+        empty = repeat('')  # Auftraggeberkonto / Bankleitzahl: not available in PDF
+        
+        return zip(
+            [format_date(t.buchungsdatum) for t in chunk],  # Buchungstag
+            [format_date(t.valuta) for t in chunk],  # Wertstellung
+            [self._get_umsatzart(t) for t in chunk],  # Umsatzart
+            [self._escape(t.verwendungszweck or t.beschreibung) for t in chunk],  # Buchungstext
+            [format_betrag(t.betrag) for t in chunk],  # Betrag
+            [self._escape(t.waehrung) for t in chunk],  # Währung
+            empty,  # Auftraggeberkonto
+            empty,  # Bankleitzahl Auftraggeberkonto
+            [self._escape(t.gegenkonto_iban or '') for t in chunk]  # IBAN Auftraggeberkonto
+        )
     
     def _get_umsatzart(self, transaction: Transaction) -> str:
         """
@@ -136,7 +227,7 @@ class CSVWriter:
         else:
             return 'Gutschrift'
     
-    def _format_betrag(self, betrag) -> str:
+    def _format_betrag(self, betrag: Decimal) -> str:
         """
         Format amount in German format with comma as decimal separator.
         
@@ -146,14 +237,4 @@ class CSVWriter:
         Returns:
             Formatted amount string (e.g., '1.234,56' or '−1.234,56')
         """
-        # Convert Decimal to float for formatting
-        amount = float(betrag)
-        
-        # Format with German locale (comma as decimal separator)
-        if amount < 0:
-            # Use minus sign (U+2212) for negative amounts
-            formatted = f"−{abs(amount):,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
-        else:
-            formatted = f"{amount:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
-        
-        return formatted
\ No newline at end of file
+        return format_betrag(betrag)
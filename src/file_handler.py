@@ -3,6 +3,8 @@ File Handler Module
 Handles file and directory operations for PDF and CSV files.
 """
 
+import os
+import stat
 from pathlib import Path
 from typing import List
 
@@ -34,27 +36,35 @@ class FileHandler:
         Raises:
             FileNotFoundError: If input_path does not exist
         """
-        self._validate_path_exists(input_path)
+        mode = self._stat_existing_path(input_path).st_mode
         
-        if input_path.is_file():
+        if stat.S_ISREG(mode):
             return self._handle_single_file(input_path)
-        elif input_path.is_dir():
+        elif stat.S_ISDIR(mode):
             return self._handle_directory(input_path)
         else:
             raise ValueError(f"Input path is neither a file nor a directory: {input_path}")
     
-    def _validate_path_exists(self, path: Path) -> None:
+    def _stat_existing_path(self, path: Path) -> os.stat_result:
         """
-        Validate that a path exists.
+        Stat a path, validating that it exists.
+        
+        A single stat call serves both the existence check and the
+        file/directory check.
         
         Args:
             path: Path to validate
             
+        Returns:
+            Stat result for the path
+            
         Raises:
             FileNotFoundError: If path does not exist
         """
-        if not path.exists():
-            raise FileNotFoundError(f"Path does not exist: {path}")
+        try:
+            return path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"Path does not exist: {path}") from None
     
     def _handle_single_file(self, file_path: Path) -> List[Path]:
         """
@@ -83,7 +93,12 @@ class FileHandler:
         Returns:
             Sorted list of PDF files in the directory
         """
-        pdf_files = [f for f in dir_path.glob("*.pdf") if self._is_pdf_file(f)]
+        with os.scandir(dir_path) as entries:
+            pdf_files = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.lower().endswith('.pdf') and entry.is_file()
+            ]
         return sorted(pdf_files)
     
     def _is_pdf_file(self, file_path: Path) -> bool:
@@ -0,0 +1,50 @@
+"""
+Formatting Module
+Shared helpers for rendering values in German (Commerzbank) notation.
+"""
+
+import functools
+from datetime import date
+from decimal import Decimal
+
+
+# Swap English separators for German ones in a single pass
+_GERMAN_SEPARATORS = str.maketrans({',': '.', '.': ','})
+
+
+@functools.lru_cache(maxsize=8192)
+def format_betrag(betrag: Decimal) -> str:
+    """
+    Format amount in German format with comma as decimal separator.
+    
+    Formats the Decimal directly (no float round-trip), so amounts stay exact.
+    Recurring amounts (subscriptions, fees) are served from the cache.
+    
+    Args:
+        betrag: Decimal amount
+        
+    Returns:
+        Formatted amount string (e.g., '1.234,56' or '−1.234,56')
+    """
+    formatted = f"{abs(betrag):,.2f}".translate(_GERMAN_SEPARATORS)
+    
+    # Use minus sign (U+2212) for negative amounts
+    if betrag < 0:
+        return f"−{formatted}"
+    return formatted
+
+
+@functools.lru_cache(maxsize=4096)
+def format_date(value: date) -> str:
+    """
+    Format date in German format (DD.MM.YYYY).
+    
+    Statements repeat the same few dates, so results are cached per date.
+    
+    Args:
+        value: Date to format
+        
+    Returns:
+        Formatted date string (e.g., '01.04.2021')
+    """
+    return f"{value.day:02d}.{value.month:02d}.{value.year:04d}"
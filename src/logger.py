@@ -3,6 +3,7 @@ Logger Module
 Professional logging with different severity levels.
 """
 
+import sys
 from typing import Optional
 
 
@@ -17,50 +18,60 @@ class Logger:
         'WARNING': '\033[93m',  # Yellow
         'SUCCESS': '\033[92m',  # Green
         'INFO': '\033[94m',     # Blue
-        'RESET': '\033[0m'      # Reset
     }
+    RESET = '\033[0m'
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, use_colors: Optional[bool] = None):
         """
         Initialize logger.
         
         Args:
             verbose: Enable verbose output
+            use_colors: Color the level tags (default: only if stdout is a TTY)
         """
         self.verbose = verbose
+        if use_colors is None:
+            use_colors = sys.stdout.isatty()
+        prefixes = self._build_prefixes(use_colors)
+        
+        # Bind each prefix to its own attribute for the log methods
+        self._error_prefix = prefixes['ERROR']
+        self._warning_prefix = prefixes['WARNING']
+        self._success_prefix = prefixes['SUCCESS']
+        self._info_prefix = prefixes['INFO']
     
-    def _format_message(self, level: str, message: str) -> str:
+    def _build_prefixes(self, use_colors: bool) -> dict:
         """
-        Format message with severity level.
+        Precompute the message prefix for every severity level.
         
         Args:
-            level: Severity level (ERROR, WARNING, SUCCESS, INFO)
-            message: Message to format
+            use_colors: Wrap the level tag in ANSI color codes
             
         Returns:
-            Formatted message string
+            Dictionary mapping level to prefix string
         """
-        color = self.COLORS.get(level, self.COLORS['RESET'])
-        reset = self.COLORS['RESET']
-        return f"{color}[{level}]{reset} {message}"
+        return {
+            level: f"{color}[{level}]{self.RESET} " if use_colors else f"[{level}] "
+            for level, color in self.COLORS.items()
+        }
     
     def error(self, message: str) -> None:
         """Log error message."""
-        print(self._format_message('ERROR', message))
+        sys.stdout.write(self._error_prefix + message + '\n')
     
     def warning(self, message: str) -> None:
         """Log warning message."""
-        print(self._format_message('WARNING', message))
+        sys.stdout.write(self._warning_prefix + message + '\n')
     
     def success(self, message: str) -> None:
         """Log success message."""
-        print(self._format_message('SUCCESS', message))
+        sys.stdout.write(self._success_prefix + message + '\n')
     
     def info(self, message: str) -> None:
         """Log info message."""
-        print(self._format_message('INFO', message))
+        sys.stdout.write(self._info_prefix + message + '\n')
     
     def debug(self, message: str) -> None:
         """Log debug message (only in verbose mode)."""
         if self.verbose:
-            print(f"[DEBUG] {message}")
\ No newline at end of file
+            sys.stdout.write('[DEBUG] ' + message + '\n')
\ No newline at end of file
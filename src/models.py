@@ -4,9 +4,10 @@ from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
 from typing import Optional
+from src.formatting import format_betrag, format_date
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """Represents a single bank transaction from a Commerzbank statement.
     
@@ -37,8 +38,8 @@ class Transaction:
             Dictionary with all transaction fields
         """
         return {
-            'buchungsdatum': self.buchungsdatum.strftime('%d.%m.%Y'),
-            'valuta': self.valuta.strftime('%d.%m.%Y'),
+            'buchungsdatum': format_date(self.buchungsdatum),
+            'valuta': format_date(self.valuta),
             'beschreibung': self.beschreibung,
             'betrag': self._format_betrag(),
             'waehrung': self.waehrung,
@@ -53,17 +54,7 @@ class Transaction:
         Returns:
             Formatted amount string (e.g., '1.234,56' or '−1.234,56')
         """
-        # Convert Decimal to float for formatting
-        amount = float(self.betrag)
-        
-        # Format with German locale (comma as decimal separator)
-        if amount < 0:
-            # Use minus sign (U+2212) for negative amounts
-            formatted = f"−{abs(amount):,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
-        else:
-            formatted = f"{amount:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
-        
-        return formatted
+        return format_betrag(self.betrag)
     
     def is_debit(self) -> bool:
         """Check if transaction is a debit (outgoing payment).
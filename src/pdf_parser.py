@@ -4,8 +4,10 @@ Extracts raw text from Commerzbank PDF bank statements.
 """
 
 from pathlib import Path
-from typing import Optional
-import pdfplumber
+from typing import TYPE_CHECKING, Iterator, Optional
+
+if TYPE_CHECKING:
+    import pdfplumber
 
 
 class PDFParser:
@@ -38,10 +40,13 @@ class PDFParser:
         """
         self._validate_pdf_exists(pdf_path)
         
+        # Imported lazily: pdfplumber pulls in pdfminer and PIL, which is
+        # slow and not needed for --help or input validation errors
+        import pdfplumber
+        
         try:
             with pdfplumber.open(pdf_path) as pdf:
-                text = self._extract_pages(pdf)
-                return text
+                return "\n".join(self._iter_pages(pdf))
         except Exception as e:
             raise ValueError(f"Failed to extract text from PDF: {e}") from e
     
@@ -58,26 +63,26 @@ class PDFParser:
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
     
-    def _extract_pages(self, pdf: pdfplumber.PDF) -> str:
+    def _iter_pages(self, pdf: "pdfplumber.PDF") -> Iterator[str]:
         """
-        Extract text from all pages in PDF.
+        Yield text of each non-empty page in PDF.
+        
+        Each page's layout objects are released once its text has been
+        extracted, so only one page is held in memory at a time.
         
         Args:
             pdf: Opened pdfplumber PDF object
             
-        Returns:
-            Combined text from all pages
+        Yields:
+            Text of each non-empty page
         """
-        pages_text = []
-        
         for page in pdf.pages:
             page_text = self._extract_page_text(page)
+            page.flush_cache()
             if page_text:
-                pages_text.append(page_text)
-        
-        return "\n".join(pages_text)
+                yield page_text
     
-    def _extract_page_text(self, page: pdfplumber.page.Page) -> Optional[str]:
+    def _extract_page_text(self, page: "pdfplumber.page.Page") -> Optional[str]:
         """
         Extract text from a single page.
         
@@ -3,23 +3,41 @@ Transaction Parser Module
 Parses transaction data from extracted PDF text.
 """
 
+import functools
 import re
-from datetime import datetime
+from datetime import date
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Match, Optional, Tuple
 from src.models import Transaction
 
 
+# Regex patterns (compiled once at import)
+_STMT_RE = re.compile(r'Kontoauszug vom \d{2}\.\d{2}\.(\d{4})')
+_BOOKING_RE = re.compile(r'Buchungsdatum: (\d{2}\.\d{2}\.\d{4})')
+_TXN_RE = re.compile(r'^(.+?)\s+(\d{2}\.\d{2})\s+([\d.,]+-?)$')
+
+# Characters a transaction line can end with (besides digits), see _TXN_RE
+_AMOUNT_TAIL_CHARS = frozenset('.,-')
+
+# German amount notation to Decimal notation: drop thousands dots, comma -> dot
+_BETRAG_TRANS = str.maketrans({'.': None, ',': '.'})
+
+# Lines that never describe a transaction (one alternation, one scan per line)
+_SKIP_RE = re.compile(
+    r'^(?:Buchungsdatum:|Mandatsref:|Gläubiger-ID:|SEPA-|Folgeseite|Kontoauszug vom'
+    r'|Auszug-Nr\.|IBAN:|BIC|Kontowährung|Angaben zu den Umsätzen)'
+    r'|End-to-End-Ref'  # Ohne ^ damit es überall matcht
+)
+
+# First characters of the anchored prefixes in _SKIP_RE
+_SKIP_FIRST_CHARS = frozenset('BMGSFKAI')
+
+
 class TransactionParser:
     """
     Parses Commerzbank transaction data from PDF text.
     """
     
-    # Regex patterns
-    STATEMENT_DATE_PATTERN = r'Kontoauszug vom (\d{2}\.\d{2}\.\d{4})'
-    BOOKING_DATE_PATTERN = r'Buchungsdatum: (\d{2}\.\d{2}\.\d{4})'
-    TRANSACTION_PATTERN = r'^(.+?)\s+(\d{2}\.\d{2})\s+([\d.,]+[-]?)$'
-    
     def __init__(self, verbose: bool = False):
         """
         Initialize transaction parser.
@@ -40,40 +58,53 @@ class TransactionParser:
         Returns:
             List of Transaction objects
             
+        Raises:
+            ValueError: If text cannot be parsed
+        """
+        return list(self.iter_parse(text))
+    
+    def iter_parse(self, text: str) -> Iterator[Transaction]:
+        """
+        Parse transactions from PDF text one at a time.
+        
+        Transactions are yielded as they are found, so a consumer such as
+        CSVWriter.write can stream them without building a list. Errors
+        are raised when iteration starts, not when this is called.
+        
+        Args:
+            text: Extracted PDF text
+            
+        Yields:
+            Transaction objects in statement order
+            
         Raises:
             ValueError: If text cannot be parsed
         """
         self._extract_year(text)
         
-        lines = text.split('\n')
-        transactions = []
+        # Strip every line once up front; all helpers work on stripped lines
+        lines = list(map(str.strip, text.splitlines()))
+        
+        # Classify every line once; the description look-ahead reuses these
+        txn_hits, book_hits = self._classify_lines(lines)
         
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        # Transactions are only recognized once a booking date has been seen
+        booking_date: Optional[date] = None
+        
+        # Only transaction and booking date lines can change the result
+        for i in self._candidate_indices(txn_hits, book_hits):
+            if booking_date is not None and txn_hits[i]:
+                trans = self._try_parse_transaction(
+                    lines, i, booking_date, txn_hits, book_hits
+                )
+                if trans:
+                    yield trans
+                    continue
             
             # Check for booking date marker
-            booking_match = re.search(self.BOOKING_DATE_PATTERN, line)
+            booking_match = book_hits[i]
             if booking_match:
-                booking_date_str = booking_match.group(1)
-                booking_date = self._parse_date(booking_date_str)
-                
-                # Parse transactions under this booking date
-                i += 1
-                while i < len(lines):
-                    trans = self._try_parse_transaction(lines, i, booking_date)
-                    if trans:
-                        transactions.append(trans)
-                        i += 1
-                    else:
-                        # Check if next line is a new booking date
-                        if re.search(self.BOOKING_DATE_PATTERN, lines[i]):
-                            break
-                        i += 1
-            else:
-                i += 1
-        
-        return transactions
+                booking_date = self._parse_date(booking_match.group(1))
     
     def _extract_year(self, text: str) -> None:
         """
@@ -85,42 +116,43 @@ class TransactionParser:
         Raises:
             ValueError: If year cannot be extracted
         """
-        match = re.search(self.STATEMENT_DATE_PATTERN, text)
+        match = _STMT_RE.search(text)
         if not match:
             raise ValueError("Could not find statement date in PDF")
         
-        date_str = match.group(1)
-        date_obj = datetime.strptime(date_str, '%d.%m.%Y')
-        self.year = date_obj.year
+        # Only the year is needed; it is captured directly
+        self.year = int(match.group(1))
     
     def _try_parse_transaction(
         self, 
         lines: List[str], 
         index: int, 
-        booking_date: datetime
+        booking_date: date,
+        txn_hits: List[Optional[Match[str]]],
+        book_hits: List[Optional[Match[str]]]
     ) -> Optional[Transaction]:
         """
         Try to parse a transaction from the current line.
         
         Args:
-            lines: All lines from PDF
+            lines: All stripped lines from PDF
             index: Current line index
             booking_date: Booking date for this transaction
+            txn_hits: Transaction pattern match per line
+            book_hits: Booking date pattern match per line
             
         Returns:
             Transaction object or None if line is not a transaction
         """
-        line = lines[index].strip()
-        
-        # Skip empty lines and known non-transaction lines
-        if not line or self._is_non_transaction_line(line):
-            return None
-        
         # Try to match transaction pattern
-        match = re.search(self.TRANSACTION_PATTERN, line)
+        match = txn_hits[index]
         if not match:
             return None
         
+        # Skip known non-transaction lines
+        if self._is_non_transaction_line(lines[index]):
+            return None
+        
         beschreibung = match.group(1).strip()
         valuta_str = match.group(2)  # DD.MM format
         betrag_str = match.group(3)
@@ -132,17 +164,69 @@ class TransactionParser:
         betrag = self._parse_betrag(betrag_str)
         
         # Collect multi-line description
-        full_description = self._collect_description(lines, index + 1, beschreibung)
+        full_description = self._collect_description(
+            lines, index + 1, beschreibung, txn_hits, book_hits
+        )
         
         return Transaction(
-            buchungsdatum=booking_date.date(),
-            valuta=valuta.date(),
+            buchungsdatum=booking_date,
+            valuta=valuta,
             beschreibung=beschreibung,
             betrag=betrag,
             waehrung="EUR",
             verwendungszweck=full_description
         )
     
+    def _classify_lines(
+        self,
+        lines: List[str]
+    ) -> Tuple[List[Optional[Match[str]]], List[Optional[Match[str]]]]:
+        """
+        Match every line against the transaction and booking date patterns.
+        
+        Cheap string checks run first so the regexes only see plausible
+        lines: transaction lines always end in the amount (a digit, a
+        separator or a trailing minus), booking lines contain the marker.
+        
+        Args:
+            lines: All stripped lines from PDF
+            
+        Returns:
+            Tuple of (transaction matches, booking date matches), one
+            entry per line (None if the line does not match)
+        """
+        txn_hits = [
+            _TXN_RE.search(line)
+            if line[-1:] in _AMOUNT_TAIL_CHARS or line[-1:].isdecimal()
+            else None
+            for line in lines
+        ]
+        book_hits = [
+            _BOOKING_RE.search(line) if 'Buchungsdatum:' in line else None
+            for line in lines
+        ]
+        return txn_hits, book_hits
+    
+    def _candidate_indices(
+        self,
+        txn_hits: List[Optional[Match[str]]],
+        book_hits: List[Optional[Match[str]]]
+    ) -> List[int]:
+        """
+        Get indices of lines that matched either pattern, in line order.
+        
+        Args:
+            txn_hits: Transaction pattern match per line
+            book_hits: Booking date pattern match per line
+            
+        Returns:
+            List of line indices in ascending order
+        """
+        return [
+            i for i, (txn_hit, book_hit) in enumerate(zip(txn_hits, book_hits))
+            if txn_hit or book_hit
+        ]
+    
     def _is_non_transaction_line(self, line: str) -> bool:
         """
         Check if line is a known non-transaction line.
@@ -153,54 +237,45 @@ class TransactionParser:
         Returns:
             True if line should be skipped
         """
-        skip_patterns = [
-            r'^Buchungsdatum:',
-            r'End-to-End-Ref',  # Ohne ^ damit es überall matcht
-            r'^Mandatsref:',
-            r'^Gläubiger-ID:',
-            r'^SEPA-',
-            r'^Folgeseite',
-            r'^Kontoauszug vom',
-            r'^Auszug-Nr\.',
-            r'^IBAN:',
-            r'^BIC',
-            r'^Kontowährung',
-            r'^Angaben zu den Umsätzen',
-        ]
-        
-        for pattern in skip_patterns:
-            if re.search(pattern, line):
-                return True
-        
-        return False
+        # Most lines start with a character no anchored skip prefix uses
+        if line[:1] not in _SKIP_FIRST_CHARS and 'End-to-End-Ref' not in line:
+            return False
+        return _SKIP_RE.search(line) is not None
     
     def _collect_description(
         self, 
         lines: List[str], 
         start_index: int, 
-        initial_desc: str
+        initial_desc: str,
+        txn_hits: List[Optional[Match[str]]],
+        book_hits: List[Optional[Match[str]]]
     ) -> str:
         """
         Collect multi-line transaction description.
         
         Args:
-            lines: All lines from PDF
+            lines: All stripped lines from PDF
             start_index: Index to start collecting from
             initial_desc: Initial description from transaction line
+            txn_hits: Transaction pattern match per line
+            book_hits: Booking date pattern match per line
             
         Returns:
             Full description string
         """
-        description_parts = [initial_desc]
+        # Only allocated once a continuation line is found
+        description_parts: Optional[List[str]] = None
         
         # Collect up to 5 lines or until next transaction
-        for i in range(start_index, min(start_index + 5, len(lines))):
-            line = lines[i].strip()
-            
+        end_index = start_index + 5
+        window = zip(
+            lines[start_index:end_index],
+            txn_hits[start_index:end_index],
+            book_hits[start_index:end_index]
+        )
+        for line, txn_hit, book_hit in window:
             # Stop if we hit another transaction or booking date
-            if re.search(self.TRANSACTION_PATTERN, line):
-                break
-            if re.search(self.BOOKING_DATE_PATTERN, line):
+            if txn_hit or book_hit:
                 break
             if not line:
                 continue
@@ -209,11 +284,15 @@ class TransactionParser:
             if self._is_non_transaction_line(line):
                 continue
             
+            if description_parts is None:
+                description_parts = [initial_desc]
             description_parts.append(line)
         
+        if description_parts is None:
+            return initial_desc
         return ' '.join(description_parts)
     
-    def _parse_date(self, date_str: str) -> datetime:
+    def _parse_date(self, date_str: str) -> date:
         """
         Parse date string in DD.MM.YYYY format.
         
@@ -221,11 +300,11 @@ class TransactionParser:
             date_str: Date string
             
         Returns:
-            datetime object
+            date object
         """
-        return datetime.strptime(date_str, '%d.%m.%Y')
+        return _make_date(date_str)
     
-    def _parse_valuta(self, valuta_str: str) -> datetime:
+    def _parse_valuta(self, valuta_str: str) -> date:
         """
         Parse valuta date (DD.MM format) and add year.
         
@@ -233,14 +312,12 @@ class TransactionParser:
             valuta_str: Valuta string in DD.MM format
             
         Returns:
-            datetime object with year added
+            date object with year added
         """
         if not self.year:
             raise ValueError("Year not extracted from statement header")
         
-        # Add year to valuta
-        full_date_str = f"{valuta_str}.{self.year}"
-        return datetime.strptime(full_date_str, '%d.%m.%Y')
+        return _make_valuta(self.year, valuta_str)
     
     def _parse_betrag(self, betrag_str: str) -> Decimal:
         """
@@ -252,20 +329,67 @@ class TransactionParser:
         Returns:
             Decimal object (negative for debits)
         """
-        # Check if amount is negative (ends with -)
-        is_negative = betrag_str.endswith('-')
-        
-        # Remove minus sign
-        betrag_str = betrag_str.rstrip('-')
-        
-        # Convert German format to standard: 1.234,56 -> 1234.56
-        betrag_str = betrag_str.replace('.', '').replace(',', '.')
+        return _parse_amount(betrag_str)
+
+
+@functools.lru_cache(maxsize=2048)
+def _make_date(date_str: str) -> date:
+    """
+    Build date from a DD.MM.YYYY string.
+    
+    Booking dates repeat across pages and statements, so results are
+    cached per string, like _make_valuta.
+    
+    Args:
+        date_str: Date string in DD.MM.YYYY format
         
-        # Convert to Decimal
-        amount = Decimal(betrag_str)
+    Returns:
+        date object
+    """
+    # Fixed layout, so slice instead of going through strptime
+    return date(int(date_str[6:10]), int(date_str[3:5]), int(date_str[0:2]))
+
+
+@functools.lru_cache(maxsize=2048)
+def _make_valuta(year: int, valuta_str: str) -> date:
+    """
+    Build valuta date from statement year and DD.MM string.
+    
+    A statement only has a few dozen distinct value dates, so results
+    are cached per (year, DD.MM); date is immutable and safe to share.
+    
+    Args:
+        year: Statement year
+        valuta_str: Valuta string in DD.MM format
         
-        # Apply negative sign
-        if is_negative:
-            amount = -amount
+    Returns:
+        date object
+    """
+    # Fixed layout, so slice instead of going through strptime
+    return date(year, int(valuta_str[3:5]), int(valuta_str[0:2]))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_amount(betrag_str: str) -> Decimal:
+    """
+    Parse amount string in German format.
+    
+    Statements repeat amounts (subscriptions, fees), so results are
+    cached per string; Decimal is immutable and safe to share.
+    
+    Args:
+        betrag_str: Amount string (e.g., '1.234,56' or '1.234,56-')
         
-        return amount
\ No newline at end of file
+    Returns:
+        Decimal object (negative for debits)
+    """
+    # Check if amount is negative (ends with -) and drop the sign
+    is_negative = betrag_str.endswith('-')
+    if is_negative:
+        betrag_str = betrag_str[:-1]
+    
+    # Convert German format to standard in one pass: 1.234,56 -> 1234.56
+    amount = Decimal(betrag_str.translate(_BETRAG_TRANS))
+    
+    # Apply negative sign
+    return -amount if is_negative else amount
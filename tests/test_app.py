@@ -0,0 +1,180 @@
+"""
+Unit tests for Application module.
+"""
+
+import argparse
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from src.app import Application, convert_pdf, _convert_pdf_task
+from src.pdf_parser import PDFParser
+
+
+SAMPLE_PDF_TEXT = """Kontoauszug vom 30.04.2021
+Angaben zu den Umsätzen Valuta
+Buchungsdatum: 01.04.2021
+MUSTERFIRMA GMBH 01.04 17,60-
+RATE PER 01.04.2021
+
+Buchungsdatum: 29.04.2021
+ARBEITGEBER AG 29.04 592,00
+Gehalt 04.2021"""
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    """Path to a (fake) PDF file in a temporary directory."""
+    return tmp_path / "statement.pdf"
+
+
+def make_args(**overrides):
+    """Build command line arguments with defaults for testing."""
+    values = {
+        'input_path': '.',
+        'output': None,
+        'workers': None,
+        'batch_size': 32,
+        'verbose': False,
+    }
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+class TestConvertPdf:
+    """Tests for convert_pdf function."""
+    
+    def test_convert_returns_transaction_count(self, pdf_file, tmp_path, monkeypatch):
+        """Test that the number of written transactions is returned."""
+        monkeypatch.setattr(PDFParser, "extract_text", lambda self, path: SAMPLE_PDF_TEXT)
+        
+        count = convert_pdf(pdf_file, tmp_path)
+        
+        assert count == 2
+        assert (tmp_path / "statement.csv").exists()
+    
+    def test_convert_without_transactions(self, pdf_file, tmp_path, monkeypatch):
+        """Test that no CSV is written when no transactions are found."""
+        text = "Kontoauszug vom 30.04.2021\nKeine Umsätze"
+        monkeypatch.setattr(PDFParser, "extract_text", lambda self, path: text)
+        
+        count = convert_pdf(pdf_file, tmp_path)
+        
+        assert count == 0
+        assert not (tmp_path / "statement.csv").exists()
+    
+    def test_convert_verbose_logs_steps(self, pdf_file, tmp_path, monkeypatch, capsys):
+        """Test that verbose mode logs each conversion step."""
+        monkeypatch.setattr(PDFParser, "extract_text", lambda self, path: SAMPLE_PDF_TEXT)
+        
+        convert_pdf(pdf_file, tmp_path, verbose=True)
+        
+        out = capsys.readouterr().out
+        assert "Extracting text from statement.pdf" in out
+        assert "Parsing transactions from statement.pdf" in out
+        assert "Wrote 2 transactions to statement.csv" in out
+    
+    def test_convert_parse_error_leaves_no_partial_csv(self, pdf_file, tmp_path, monkeypatch):
+        """Test that a parse error after the first transaction writes no CSV."""
+        text = SAMPLE_PDF_TEXT.replace("ARBEITGEBER AG 29.04", "ARBEITGEBER AG 31.02")
+        monkeypatch.setattr(PDFParser, "extract_text", lambda self, path: text)
+        
+        with pytest.raises(ValueError):
+            convert_pdf(pdf_file, tmp_path)
+        
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestConvertPdfTask:
+    """Tests for _convert_pdf_task function."""
+    
+    def test_task_success(self, pdf_file, tmp_path, monkeypatch):
+        """Test that a successful conversion has no error."""
+        monkeypatch.setattr(PDFParser, "extract_text", lambda self, path: SAMPLE_PDF_TEXT)
+        
+        assert _convert_pdf_task(pdf_file, tmp_path, False) == (2, None, None)
+    
+    def test_task_captures_error(self, pdf_file, tmp_path, monkeypatch):
+        """Test that errors are returned instead of raised."""
+        monkeypatch.setattr(PDFParser, "extract_text", lambda self, path: "No header")
+        
+        count, error, details = _convert_pdf_task(pdf_file, tmp_path, False)
+        
+        assert count == 0
+        assert "Could not find statement date" in error
+        assert "Traceback" in details
+
+
+class TestGetWorkerCount:
+    """Tests for _get_worker_count method."""
+    
+    def test_explicit_workers(self):
+        """Test that --workers is used when given."""
+        app = Application(make_args(workers=3))
+        assert app._get_worker_count(10) == 3
+    
+    def test_capped_by_file_count(self):
+        """Test that there are never more workers than files."""
+        app = Application(make_args(workers=8))
+        assert app._get_worker_count(2) == 2
+    
+    def test_defaults_to_cpu_count(self, monkeypatch):
+        """Test that the CPU count is used when --workers is not given."""
+        monkeypatch.setattr("src.app.os.cpu_count", lambda: 4)
+        app = Application(make_args())
+        assert app._get_worker_count(10) == 4
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """Thread pool standing in for the process pool, recording each batch."""
+    
+    batches = []
+    
+    def map(self, fn, *iterables, chunksize=1):
+        """Record the batch of PDF files and run it on threads."""
+        batch = list(iterables[0])
+        self.batches.append(batch)
+        return super().map(fn, batch, *iterables[1:])
+
+
+class TestProcessPdfs:
+    """Tests for _process_pdfs method."""
+    
+    @pytest.fixture
+    def statements(self, tmp_path, monkeypatch):
+        """Mix of good, empty and failing (fake) PDFs with patched extraction."""
+        texts = {
+            "a.pdf": SAMPLE_PDF_TEXT,
+            "b.pdf": "Kontoauszug vom 30.04.2021\nKeine Umsätze",
+            "c.pdf": "No header",
+            "d.pdf": SAMPLE_PDF_TEXT,
+            "e.pdf": SAMPLE_PDF_TEXT,
+        }
+        monkeypatch.setattr(PDFParser, "extract_text", lambda self, path: texts[path.name])
+        monkeypatch.setattr("src.app.ProcessPoolExecutor", RecordingExecutor)
+        monkeypatch.setattr(RecordingExecutor, "batches", [])
+        return [tmp_path / name for name in texts]
+    
+    def test_process_reports_each_file_and_summary(self, statements, tmp_path, capsys):
+        """Test per-file results and the final summary across batches."""
+        app = Application(make_args(workers=2, batch_size=2))
+        
+        app._process_pdfs(statements, tmp_path)
+        
+        lines = capsys.readouterr().out.splitlines()
+        assert lines == [
+            "[SUCCESS] Successfully converted a.pdf (2 transactions)",
+            "[WARNING] No transactions found in b.pdf",
+            "[ERROR] Failed to process c.pdf: Could not find statement date in PDF",
+            "[SUCCESS] Successfully converted d.pdf (2 transactions)",
+            "[SUCCESS] Successfully converted e.pdf (2 transactions)",
+            "[INFO] ",
+            "Processing complete: 3 successful, 1 failed",
+        ]
+        assert sorted(p.name for p in tmp_path.glob("*.csv")) == ["a.csv", "d.csv", "e.csv"]
+    
+    def test_process_dispatches_in_batches(self, statements, tmp_path):
+        """Test that files are dispatched in batches of --batch-size."""
+        app = Application(make_args(workers=2, batch_size=2))
+        
+        app._process_pdfs(statements, tmp_path)
+        
+        assert RecordingExecutor.batches == [statements[0:2], statements[2:4], statements[4:5]]
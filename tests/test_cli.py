@@ -0,0 +1,42 @@
+"""
+Unit tests for CLI module.
+"""
+
+import sys
+import pytest
+from src.cli import parse_arguments
+
+
+def parse(monkeypatch, *argv):
+    """Parse the given command line arguments."""
+    monkeypatch.setattr(sys, "argv", ["main.py", *argv])
+    return parse_arguments()
+
+
+class TestParseArguments:
+    """Tests for parse_arguments function."""
+    
+    def test_defaults(self, monkeypatch):
+        """Test default values for the optional arguments."""
+        args = parse(monkeypatch, "statements/")
+        
+        assert args.input_path == "statements/"
+        assert args.workers is None
+        assert args.batch_size == 32
+    
+    def test_workers_and_batch_size(self, monkeypatch):
+        """Test that --workers and --batch-size are parsed."""
+        args = parse(monkeypatch, "statements/", "-j", "4", "--batch-size", "64")
+        
+        assert args.workers == 4
+        assert args.batch_size == 64
+    
+    @pytest.mark.parametrize("option", ["--workers", "--batch-size"])
+    @pytest.mark.parametrize("value", ["0", "-1"])
+    def test_rejects_values_below_one(self, monkeypatch, capsys, option, value):
+        """Test that --workers and --batch-size must be at least 1."""
+        with pytest.raises(SystemExit) as excinfo:
+            parse(monkeypatch, "statements/", option, value)
+        
+        assert excinfo.value.code == 2
+        assert f"{option} must be at least 1" in capsys.readouterr().err
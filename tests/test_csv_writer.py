@@ -59,6 +59,12 @@ class TestWriteCSV:
         assert output_path.exists()
         assert output_path.is_file()
     
+    def test_write_returns_transaction_count(self, csv_writer, sample_transactions, tmp_path):
+        """Test that write returns the number of transactions written."""
+        output_path = tmp_path / "output.csv"
+        
+        assert csv_writer.write(sample_transactions, output_path) == 3
+    
     def test_write_csv_has_correct_header(self, csv_writer, sample_transactions, tmp_path):
         """Test that CSV has correct header row."""
         output_path = tmp_path / "output.csv"
@@ -136,6 +142,74 @@ class TestWriteCSV:
         with pytest.raises(ValueError, match="transactions list is empty"):
             csv_writer.write([], output_path)
     
+    def test_write_accepts_generator(self, csv_writer, sample_transactions, tmp_path):
+        """Test that transactions can be streamed from a generator."""
+        output_path = tmp_path / "output.csv"
+        
+        csv_writer.write((t for t in sample_transactions), output_path)
+        
+        with open(output_path, 'r', encoding='utf-8') as f:
+            rows = list(csv.reader(f, delimiter=';'))
+            
+            assert len(rows) == 4  # Header + 3 transactions
+    
+    def test_write_across_chunk_boundaries(self, csv_writer, sample_transactions, tmp_path):
+        """Test that rows keep their order when split into several chunks."""
+        output_path = tmp_path / "output.csv"
+        csv_writer.CHUNK_SIZE = 2
+        
+        csv_writer.write(sample_transactions, output_path)
+        
+        with open(output_path, 'r', encoding='utf-8') as f:
+            reader = csv.reader(f, delimiter=';')
+            next(reader)  # Skip header
+            amounts = [row[4] for row in reader]
+            
+            assert amounts == ['−17,60', '−24,95', '592,00']
+    
+    def test_write_empty_generator_raises_error(self, csv_writer, tmp_path):
+        """Test that an empty generator raises error without creating a file."""
+        output_path = tmp_path / "output.csv"
+        
+        with pytest.raises(ValueError, match="transactions list is empty"):
+            csv_writer.write(iter([]), output_path)
+        
+        assert not output_path.exists()
+    
+    def test_write_error_mid_stream_keeps_existing_file(self, csv_writer, sample_transactions, tmp_path):
+        """Test that an error while streaming leaves no partial CSV behind."""
+        output_path = tmp_path / "output.csv"
+        output_path.write_text("previous export", encoding='utf-8')
+        
+        def failing_transactions():
+            yield sample_transactions[0]
+            raise ValueError("day is out of range for month")
+        
+        with pytest.raises(ValueError, match="out of range"):
+            csv_writer.write(failing_transactions(), output_path)
+        
+        assert output_path.read_text(encoding='utf-8') == "previous export"
+        assert list(tmp_path.iterdir()) == [output_path]
+    
+    def test_write_special_characters_match_csv_module(self, csv_writer, tmp_path):
+        """Test that quotes, delimiters and newlines are written like csv.writer."""
+        transaction = Transaction(
+            buchungsdatum=date(2021, 4, 1),
+            valuta=date(2021, 4, 1),
+            beschreibung='SHOP "BEST"; GMBH\nZEILE 2',
+            betrag=Decimal('-1.00')
+        )
+        output_path = tmp_path / "output.csv"
+        
+        csv_writer.write([transaction], output_path)
+        
+        with open(output_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f, delimiter=';')
+            next(reader)  # Skip header
+            row = next(reader)
+            
+            assert row[3] == 'SHOP "BEST"; GMBH\nZEILE 2'
+    
     def test_write_invalid_extension_raises_error(self, csv_writer, sample_transactions, tmp_path):
         """Test that invalid file extension raises error."""
         output_path = tmp_path / "output.txt"
@@ -154,6 +228,13 @@ class TestWriteCSV:
                 csv_writer.write(sample_transactions, output_path)
         finally:
             output_path.chmod(0o644)  # Restore permissions
+    
+    def test_write_missing_parent_directory(self, csv_writer, sample_transactions, tmp_path):
+        """Test that a missing output directory raises FileNotFoundError."""
+        output_path = tmp_path / "missing" / "output.csv"
+        
+        with pytest.raises(FileNotFoundError):
+            csv_writer.write(sample_transactions, output_path)
 
 
 class TestFormatBetrag:
@@ -225,4 +306,23 @@ class TestVerboseMode:
     def test_verbose_mode_disabled(self):
         """Test that verbose mode is disabled by default."""
         writer = CSVWriter(verbose=False)
-        assert writer.verbose is False
\ No newline at end of file
+        assert writer.verbose is False
+
+
+class TestBufferSize:
+    """Tests for buffer_size option."""
+    
+    def test_default_buffer_size(self):
+        """Test that default buffer size is used."""
+        writer = CSVWriter()
+        assert writer.buffer_size == CSVWriter.BUFFER_SIZE
+    
+    def test_small_buffer_writes_same_output(self, sample_transactions, tmp_path):
+        """Test that buffer size does not change CSV content."""
+        default_path = tmp_path / "default.csv"
+        small_path = tmp_path / "small.csv"
+        
+        CSVWriter().write(sample_transactions, default_path)
+        CSVWriter(buffer_size=16).write(sample_transactions, small_path)
+        
+        assert small_path.read_bytes() == default_path.read_bytes()
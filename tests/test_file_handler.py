@@ -66,6 +66,15 @@ class TestFindPdfFiles:
         with pytest.raises(ValueError, match="not a PDF"):
             file_handler.find_pdf_files(txt_file)
     
+    def test_directory_ignores_subdirectories(self, file_handler, temp_pdf_structure):
+        """Test that subdirectories with a .pdf suffix are not returned."""
+        (temp_pdf_structure / "folder.pdf").mkdir()
+        
+        result = file_handler.find_pdf_files(temp_pdf_structure)
+        
+        assert temp_pdf_structure / "folder.pdf" not in result
+        assert len(result) == 2
+    
     def test_empty_directory_returns_empty_list(self, file_handler, tmp_path):
         """Test that empty directory returns empty list."""
         empty_dir = tmp_path / "empty"
@@ -0,0 +1,40 @@
+"""
+Unit tests for formatting module.
+"""
+
+from datetime import date
+from decimal import Decimal
+from src.formatting import format_betrag, format_date
+
+
+class TestFormatBetrag:
+    """Tests for format_betrag function."""
+    
+    def test_format_negative_amount(self):
+        """Test formatting negative amount with minus sign (U+2212)."""
+        assert format_betrag(Decimal('-1234.56')) == '−1.234,56'
+    
+    def test_format_positive_amount(self):
+        """Test formatting positive amount."""
+        assert format_betrag(Decimal('592.00')) == '592,00'
+    
+    def test_format_zero(self):
+        """Test formatting zero amount."""
+        assert format_betrag(Decimal('0.00')) == '0,00'
+    
+    def test_format_large_amount_is_exact(self):
+        """Test that large amounts keep their cents (no float round-trip)."""
+        assert format_betrag(Decimal('1234567890123456.78')) == '1.234.567.890.123.456,78'
+
+
+class TestFormatDate:
+    """Tests for format_date function."""
+    
+    def test_format_date_pads_day_and_month(self):
+        """Test that day and month are zero-padded."""
+        assert format_date(date(2021, 4, 1)) == '01.04.2021'
+    
+    def test_format_date_matches_strftime(self):
+        """Test that output matches strftime('%d.%m.%Y')."""
+        value = date(2023, 12, 15)
+        assert format_date(value) == value.strftime('%d.%m.%Y')
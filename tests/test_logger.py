@@ -0,0 +1,65 @@
+"""
+Unit tests for Logger module.
+"""
+
+import sys
+import pytest
+from src.logger import Logger
+
+
+@pytest.fixture
+def logger():
+    """Create Logger instance for testing."""
+    return Logger(verbose=False, use_colors=False)
+
+
+class TestLogMessages:
+    """Tests for log methods."""
+    
+    def test_error_message(self, logger, capsys):
+        """Test that error messages are prefixed with level."""
+        logger.error("Something failed")
+        
+        assert capsys.readouterr().out == "[ERROR] Something failed\n"
+    
+    def test_info_message(self, logger, capsys):
+        """Test that info messages are prefixed with level."""
+        logger.info("Found 2 PDF file(s)")
+        
+        assert capsys.readouterr().out == "[INFO] Found 2 PDF file(s)\n"
+    
+    def test_debug_hidden_without_verbose(self, logger, capsys):
+        """Test that debug messages are suppressed by default."""
+        logger.debug("Details")
+        
+        assert capsys.readouterr().out == ""
+    
+    def test_debug_shown_with_verbose(self, capsys):
+        """Test that debug messages are shown in verbose mode."""
+        Logger(verbose=True, use_colors=False).debug("Details")
+        
+        assert capsys.readouterr().out == "[DEBUG] Details\n"
+
+
+class TestPrefixes:
+    """Tests for prefix construction."""
+    
+    def test_colored_prefix(self, capsys):
+        """Test that colored prefixes wrap the level in ANSI codes."""
+        Logger(use_colors=True).error("Something failed")
+        
+        assert capsys.readouterr().out == "\033[91m[ERROR]\033[0m Something failed\n"
+    
+    def test_colored_prefix_on_tty(self, capsys, monkeypatch):
+        """Test that colors are enabled by default when stdout is a TTY."""
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+        Logger().success("Done")
+        
+        assert capsys.readouterr().out == "\033[92m[SUCCESS]\033[0m Done\n"
+    
+    def test_plain_prefix_when_not_a_tty(self, capsys, monkeypatch):
+        """Test that output to a pipe has no color codes."""
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: False)
+        Logger().warning("Careful")
+        
+        assert capsys.readouterr().out == "[WARNING] Careful\n"
@@ -9,16 +9,7 @@ from src.transaction_parser import TransactionParser
 from src.models import Transaction
 
 
-@pytest.fixture
-def transaction_parser():
-    """Create TransactionParser instance for testing."""
-    return TransactionParser(verbose=False)
-
-
-@pytest.fixture
-def sample_pdf_text():
-    """Sample PDF text with transactions for testing."""
-    return """Kontoauszug vom 30.04.2021
+SAMPLE_PDF_TEXT = """Kontoauszug vom 30.04.2021
 Auszug-Nr. 4 Seite-Nr. 1
 IBAN: DE00 0000 0000 0000 0000 00
 BIC : COBADEFFXXX
@@ -55,6 +46,22 @@ End-to-End-Ref.: XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX
 Neuer Kontostand vom 30.04.2021 691,03"""
 
 
+@pytest.fixture(scope="module")
+def transaction_parser():
+    """
+    Create TransactionParser instance shared by the module's tests.
+    
+    Tests that depend on the parser's year state reset it explicitly.
+    """
+    return TransactionParser(verbose=False)
+
+
+@pytest.fixture(scope="session")
+def sample_pdf_text():
+    """Sample PDF text with transactions for testing."""
+    return SAMPLE_PDF_TEXT
+
+
 class TestParseTransactions:
     """Tests for parse method."""
     
@@ -64,7 +71,7 @@ class TestParseTransactions:
         
         assert isinstance(transactions, list)
         assert len(transactions) > 0
-        assert all(isinstance(t, Transaction) for t in transactions)
+        assert {type(t) for t in transactions} == {Transaction}
     
     def test_parse_extracts_correct_number_of_transactions(self, transaction_parser, sample_pdf_text):
         """Test that correct number of transactions are extracted."""
@@ -104,69 +111,67 @@ class TestParseTransactions:
         assert date(2021, 4, 6) in booking_dates
         assert date(2021, 4, 29) in booking_dates
     
+    def test_iter_parse_yields_same_transactions(self, transaction_parser, sample_pdf_text):
+        """Test that iter_parse streams the same transactions as parse."""
+        streamed = list(transaction_parser.iter_parse(sample_pdf_text))
+        
+        assert streamed == transaction_parser.parse(sample_pdf_text)
+    
     def test_parse_invalid_text_raises_error(self, transaction_parser):
         """Test that text without statement date raises error."""
         invalid_text = """Some random text
         without proper header
         Buchungsdatum: 01.04.2021"""
         
-        with pytest.raises(ValueError, match="Could not find statement date"):
+        with pytest.raises(ValueError) as excinfo:
             transaction_parser.parse(invalid_text)
+        
+        assert "Could not find statement date" in str(excinfo.value)
 
 
 class TestExtractYear:
     """Tests for _extract_year method."""
     
-    def test_extract_year_from_header(self, transaction_parser):
+    @pytest.mark.parametrize(
+        "text,year",
+        [
+            ("Kontoauszug vom 30.04.2021\nSome other text", 2021),
+            ("Kontoauszug vom 15.12.2023\nSome other text", 2023),
+        ],
+        ids=["from_header", "different_date"]
+    )
+    def test_extract_year(self, transaction_parser, text, year):
         """Test extracting year from statement header."""
-        text = "Kontoauszug vom 30.04.2021\nSome other text"
-        
-        transaction_parser._extract_year(text)
-        
-        assert transaction_parser.year == 2021
-    
-    def test_extract_year_different_date(self, transaction_parser):
-        """Test extracting year with different date."""
-        text = "Kontoauszug vom 15.12.2023\nSome other text"
-        
         transaction_parser._extract_year(text)
         
-        assert transaction_parser.year == 2023
+        assert transaction_parser.year == year
     
     def test_extract_year_missing_raises_error(self, transaction_parser):
         """Test that missing statement date raises error."""
         text = "Some text without statement date"
         
-        with pytest.raises(ValueError, match="Could not find statement date"):
+        with pytest.raises(ValueError) as excinfo:
             transaction_parser._extract_year(text)
+        
+        assert "Could not find statement date" in str(excinfo.value)
 
 
 class TestParseBetrag:
     """Tests for _parse_betrag method."""
     
-    def test_parse_negative_amount(self, transaction_parser):
-        """Test parsing negative amount."""
-        result = transaction_parser._parse_betrag("17,60-")
-        
-        assert result == Decimal('-17.60')
-    
-    def test_parse_positive_amount(self, transaction_parser):
-        """Test parsing positive amount."""
-        result = transaction_parser._parse_betrag("592,00")
-        
-        assert result == Decimal('592.00')
-    
-    def test_parse_amount_with_thousands(self, transaction_parser):
-        """Test parsing amount with thousands separator."""
-        result = transaction_parser._parse_betrag("1.234,56-")
-        
-        assert result == Decimal('-1234.56')
-    
-    def test_parse_large_amount(self, transaction_parser):
-        """Test parsing large amount."""
-        result = transaction_parser._parse_betrag("12.345,67")
-        
-        assert result == Decimal('12345.67')
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("17,60-", Decimal('-17.60')),
+            ("592,00", Decimal('592.00')),
+            ("1.234,56-", Decimal('-1234.56')),
+            ("12.345,67", Decimal('12345.67')),
+        ],
+        ids=["negative", "positive", "thousands", "large"]
+    )
+    def test_parse_betrag(self, transaction_parser, raw, expected):
+        """Test parsing German amount strings."""
+        assert transaction_parser._parse_betrag(raw) == expected
 
 
 class TestParseValuta:
@@ -184,8 +189,12 @@ class TestParseValuta:
     
     def test_parse_valuta_without_year_raises_error(self, transaction_parser):
         """Test that parsing valuta without year raises error."""
-        with pytest.raises(ValueError, match="Year not extracted"):
+        transaction_parser.year = None
+        
+        with pytest.raises(ValueError) as excinfo:
             transaction_parser._parse_valuta("01.04")
+        
+        assert "Year not extracted" in str(excinfo.value)
 
 
 class TestIsNonTransactionLine: